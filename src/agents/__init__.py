@@ -1,4 +1,10 @@
 """Agent modules for building specification extraction."""
-from agents.orchestrator import run_extraction
-
 __all__ = ["run_extraction"]
+
+
+def __getattr__(name):
+    # Import the orchestrator on first use so agents.cli starts quickly
+    if name == "run_extraction":
+        from agents.orchestrator import run_extraction
+        return run_extraction
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,7 +8,6 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 import click
 import yaml
-from agents.orchestrator import run_extraction, ALL_DOMAINS
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +129,9 @@ def extract_one(eval_id: str, evals_dir: Path, output: Path, verbose: bool, doma
 
     EVAL_ID is the evaluation case identifier (e.g., chamberlin-circle).
     """
+    # Deferred so --help doesn't load the schemas and CV stack
+    from agents.orchestrator import run_extraction, ALL_DOMAINS
+
     # Check Claude CLI is available
     check_claude_cli()
 
@@ -251,6 +253,9 @@ def extract_all(evals_dir: Path, skip_existing: bool, force: bool, verbose: bool
     Processes eval cases from manifest.yaml. Use --eval/--exclude to filter,
     --domains to extract specific domains, --workers for parallelism.
     """
+    # Deferred so --help doesn't load the schemas and CV stack
+    from agents.orchestrator import run_extraction, ALL_DOMAINS
+
     # Check Claude CLI is available
     check_claude_cli()
 
@@ -27,9 +27,6 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
 from schemas.discovery import DocumentMap, PDFSource, CACHE_VERSION
-from cv_sensors import detect_north_arrow_angle, measure_wall_edge_angles
-from cv_sensors.wall_detection import estimate_building_rotation
-import numpy as np
 from schemas.building_spec import (
     BuildingSpec, ProjectInfo, EnvelopeInfo, ZoneInfo, WallComponent,
     WindowComponent, HVACSystem, WaterHeatingSystem,
@@ -42,6 +39,7 @@ from schemas.takeoff_spec import (
     UncertaintyFlag, AssumptionEntry
 )
 from schemas.transform import transform_takeoff_to_building_spec
+from schemas.validation import validate_list
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +99,8 @@ def _convert_numpy_types(obj: Any) -> Any:
     Returns:
         Object with all numpy types converted to Python types
     """
+    import numpy as np
+
     if isinstance(obj, np.integer):
         return int(obj)
     elif isinstance(obj, np.floating):
@@ -132,6 +132,11 @@ def run_cv_sensors(eval_dir: Path, document_map: DocumentMap) -> Dict[str, Any]:
             "site_plan_page": int
         }
     """
+    # OpenCV/numpy/pymupdf take ~150ms to import; only pay for them here
+    from cv_sensors import (
+        detect_north_arrow_angle, measure_wall_edge_angles, estimate_building_rotation,
+    )
+
     # Find best candidate site plan page
     relevant_pages = get_relevant_pages_for_domain("orientation", document_map)
     if not relevant_pages:
@@ -1427,12 +1432,12 @@ def merge_extractions(
     extraction_status["zones"] = zones_status
     if zones_data:
         if "zones" in zones_data:
-            zones = [ZoneInfo.model_validate(z) for z in zones_data["zones"]]
+            zones = validate_list(ZoneInfo, zones_data["zones"])
             spec.zones, zone_conflicts = deduplicate_by_name(zones, "zones")
             conflicts.extend(zone_conflicts)
             logger.info(f"Merged {len(spec.zones)} zones")
         if "walls" in zones_data:
-            walls = [WallComponent.model_validate(w) for w in zones_data["walls"]]
+            walls = validate_list(WallComponent, zones_data["walls"])
             spec.walls, wall_conflicts = deduplicate_by_name(walls, "zones")
             conflicts.extend(wall_conflicts)
             logger.info(f"Merged {len(spec.walls)} walls")
@@ -1441,7 +1446,7 @@ def merge_extractions(
     windows_data, windows_status = domain_extractions["windows"]
     extraction_status["windows"] = windows_status
     if windows_data and "windows" in windows_data:
-        windows = [WindowComponent.model_validate(w) for w in windows_data["windows"]]
+        windows = validate_list(WindowComponent, windows_data["windows"])
         spec.windows, window_conflicts = deduplicate_by_name(windows, "windows")
         conflicts.extend(window_conflicts)
         logger.info(f"Merged {len(spec.windows)} windows")
@@ -1450,7 +1455,7 @@ def merge_extractions(
     hvac_data, hvac_status = domain_extractions["hvac"]
     extraction_status["hvac"] = hvac_status
     if hvac_data and "hvac_systems" in hvac_data:
-        systems = [HVACSystem.model_validate(s) for s in hvac_data["hvac_systems"]]
+        systems = validate_list(HVACSystem, hvac_data["hvac_systems"])
         spec.hvac_systems, hvac_conflicts = deduplicate_by_name(systems, "hvac")
         conflicts.extend(hvac_conflicts)
         logger.info(f"Merged {len(spec.hvac_systems)} HVAC systems")
@@ -1459,7 +1464,7 @@ def merge_extractions(
     dhw_data, dhw_status = domain_extractions["dhw"]
     extraction_status["dhw"] = dhw_status
     if dhw_data and "water_heating_systems" in dhw_data:
-        wh_systems = [WaterHeatingSystem.model_validate(s) for s in dhw_data["water_heating_systems"]]
+        wh_systems = validate_list(WaterHeatingSystem, dhw_data["water_heating_systems"])
         spec.water_heating_systems, dhw_conflicts = deduplicate_by_name(wh_systems, "dhw")
         conflicts.extend(dhw_conflicts)
         logger.info(f"Merged {len(spec.water_heating_systems)} water heating systems")
@@ -1548,31 +1553,31 @@ def merge_to_takeoff_spec(
         if "thermal_boundary" in zones_data:
             tb = zones_data["thermal_boundary"]
             if "conditioned_zones" in tb:
-                thermal_boundary.conditioned_zones = [
-                    ConditionedZone.model_validate(z) for z in tb["conditioned_zones"]
-                ]
+                thermal_boundary.conditioned_zones = validate_list(
+                    ConditionedZone, tb["conditioned_zones"]
+                )
             if "unconditioned_zones" in tb:
                 from schemas.takeoff_spec import UnconditionedZone
-                thermal_boundary.unconditioned_zones = [
-                    UnconditionedZone.model_validate(z) for z in tb["unconditioned_zones"]
-                ]
+                thermal_boundary.unconditioned_zones = validate_list(
+                    UnconditionedZone, tb["unconditioned_zones"]
+                )
             if "total_conditioned_floor_area" in tb:
                 thermal_boundary.total_conditioned_floor_area = tb["total_conditioned_floor_area"]
             logger.info(f"Merged thermal_boundary: {len(thermal_boundary.conditioned_zones)} conditioned zones")
 
         # Handle ceilings if present
         if "ceilings" in zones_data:
-            ceilings = [CeilingEntry.model_validate(c) for c in zones_data["ceilings"]]
+            ceilings = validate_list(CeilingEntry, zones_data["ceilings"])
             logger.info(f"Merged {len(ceilings)} ceilings")
 
         # Handle slab_floors if present
         if "slab_floors" in zones_data:
-            slab_floors = [SlabEntry.model_validate(s) for s in zones_data["slab_floors"]]
+            slab_floors = validate_list(SlabEntry, zones_data["slab_floors"])
             logger.info(f"Merged {len(slab_floors)} slab floors")
 
         # Collect flags from zones extraction
         if "flags" in zones_data:
-            flags.extend([UncertaintyFlag.model_validate(f) for f in zones_data["flags"]])
+            flags.extend(validate_list(UncertaintyFlag, zones_data["flags"]))
 
     # Merge windows data (fenestration nested under house_walls)
     windows_data, _ = domain_extractions.get("windows", (None, None))
@@ -1590,9 +1595,9 @@ def merge_to_takeoff_spec(
                         setattr(house_walls, orientation, OrientationWall.model_validate(wall_data))
                     elif "fenestration" in wall_data:
                         # Add fenestration to existing wall
-                        existing_wall.fenestration = [
-                            FenestrationEntry.model_validate(f) for f in wall_data["fenestration"]
-                        ]
+                        existing_wall.fenestration = validate_list(
+                            FenestrationEntry, wall_data["fenestration"]
+                        )
             logger.info("Merged fenestration from windows-extractor")
 
         # Legacy format: flat windows list (convert to orientation-based)
@@ -1624,23 +1629,23 @@ def merge_to_takeoff_spec(
 
         # Collect flags from windows extraction
         if "flags" in windows_data:
-            flags.extend([UncertaintyFlag.model_validate(f) for f in windows_data["flags"]])
+            flags.extend(validate_list(UncertaintyFlag, windows_data["flags"]))
 
     # Merge HVAC systems
     hvac_data, _ = domain_extractions.get("hvac", (None, None))
     if hvac_data and "hvac_systems" in hvac_data:
-        hvac_systems = [HVACSystemEntry.model_validate(s) for s in hvac_data["hvac_systems"]]
+        hvac_systems = validate_list(HVACSystemEntry, hvac_data["hvac_systems"])
         logger.info(f"Merged {len(hvac_systems)} HVAC systems")
         if "flags" in hvac_data:
-            flags.extend([UncertaintyFlag.model_validate(f) for f in hvac_data["flags"]])
+            flags.extend(validate_list(UncertaintyFlag, hvac_data["flags"]))
 
     # Merge DHW systems
     dhw_data, _ = domain_extractions.get("dhw", (None, None))
     if dhw_data and "dhw_systems" in dhw_data:
-        dhw_systems = [DHWSystem.model_validate(s) for s in dhw_data["dhw_systems"]]
+        dhw_systems = validate_list(DHWSystem, dhw_data["dhw_systems"])
         logger.info(f"Merged {len(dhw_systems)} DHW systems")
         if "flags" in dhw_data:
-            flags.extend([UncertaintyFlag.model_validate(f) for f in dhw_data["flags"]])
+            flags.extend(validate_list(UncertaintyFlag, dhw_data["flags"]))
 
     # Build TakeoffSpec
     takeoff_spec = TakeoffSpec(
@@ -1722,12 +1727,17 @@ def run_extraction(
         t0 = time.monotonic()
         cache_dir = eval_dir.parent / ".cache"
         cache_file = cache_dir / f"{eval_name}_discovery.json"
+        cache_hit = False
         if cache_file.exists():
             try:
-                with open(cache_file) as cf:
-                    cache_data = json.load(cf)
-                if cache_data.get("cache_version", 1) >= CACHE_VERSION:
-                    document_map = DocumentMap.model_validate(cache_data)
+                # Parse and validate in one pydantic-core pass over the raw bytes
+                document_map = DocumentMap.model_validate_json(cache_file.read_bytes())
+                # v1 caches predate the cache_version key, so don't trust its default
+                if (
+                    "cache_version" in document_map.model_fields_set
+                    and document_map.cache_version >= CACHE_VERSION
+                ):
+                    cache_hit = True
                     logger.info(f"Using cached discovery for {eval_name}")
                 else:
                     document_map = run_discovery(eval_dir, source_pdfs)
@@ -1735,10 +1745,10 @@ def run_extraction(
                 document_map = run_discovery(eval_dir, source_pdfs)
         else:
             document_map = run_discovery(eval_dir, source_pdfs)
-        # Save cache
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(cache_file, "w") as cf:
-            json.dump(document_map.model_dump(), cf, indent=2)
+        # Save cache (a hit is already on disk as-is)
+        if not cache_hit:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(document_map.model_dump_json(indent=2), encoding="utf-8")
         timing["discovery"] = round(time.monotonic() - t0, 1)
 
         # Step 2: Orientation + Project extraction in parallel
@@ -2,10 +2,14 @@
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.syntax import Syntax, SyntaxTheme
 from rich.prompt import Prompt
 from rich.table import Table
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
 import tempfile
 import subprocess
 import os
@@ -14,6 +18,36 @@ from .critic import InstructionProposal
 
 console = Console()
 
+# Delta cell formats keyed by sign of the change; metrics improve upward,
+# error counts improve downward
+_METRIC_DELTA_FMT = {
+    1: "[green]+{:.3f}[/green]",
+    -1: "[red]{:.3f}[/red]",
+    0: "[dim]{:.3f}[/dim]",
+}
+_ERROR_DELTA_FMT = {
+    1: "[red]{:+d}[/red]",
+    -1: "[green]{:+d}[/green]",
+    0: "[dim]{:+d}[/dim]",
+}
+
+
+def _sign(delta: float, tolerance: float = 0) -> int:
+    """Return 1, -1 or 0 for delta, treating |delta| <= tolerance as 0."""
+    return (delta > tolerance) - (delta < -tolerance)
+
+
+@lru_cache(maxsize=1)
+def _markdown_lexer() -> Lexer:
+    """Markdown lexer, built once and shared across proposals."""
+    return get_lexer_by_name("markdown")
+
+
+@lru_cache(maxsize=None)
+def _syntax_theme(name: str) -> SyntaxTheme:
+    """Syntax theme by name, built once and shared across proposals."""
+    return Syntax.get_theme(name)
+
 
 def present_proposal(proposal: InstructionProposal) -> str:
     """
@@ -56,7 +90,12 @@ def present_proposal(proposal: InstructionProposal) -> str:
 
     # Show proposed change with syntax highlighting
     console.print("\n[bold]Proposed Change:[/bold]")
-    syntax = Syntax(proposal.proposed_change, "markdown", theme="monokai", line_numbers=False)
+    syntax = Syntax(
+        proposal.proposed_change,
+        _markdown_lexer(),
+        theme=_syntax_theme("monokai"),
+        line_numbers=False,
+    )
     console.print(syntax)
 
     # Show expected impact
@@ -82,6 +121,15 @@ def present_proposal(proposal: InstructionProposal) -> str:
     return {"a": "accept", "e": "edit", "r": "reject", "s": "skip"}[choice]
 
 
+def _run_editor(editor: str, path: str) -> int:
+    """Run editor on path, wait for it, and return its exit code."""
+    if not hasattr(os, "posix_spawnp"):
+        return subprocess.run([editor, path]).returncode
+    pid = os.posix_spawnp(editor, [editor, path], os.environ)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
 def edit_proposal(proposal: InstructionProposal) -> Optional[InstructionProposal]:
     """
     Allow user to edit the proposed_change text.
@@ -90,27 +138,34 @@ def edit_proposal(proposal: InstructionProposal) -> Optional[InstructionProposal
     Returns modified proposal or None if cancelled.
     """
     # Create temp file with proposed change
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-        f.write(f"# Edit Proposed Change\n")
-        f.write(f"# Target: {proposal.target_file}\n")
-        f.write(f"# Save and close to apply, or delete all content to cancel\n\n")
-        f.write(proposal.proposed_change)
-        temp_path = f.name
+    fd, temp_path = tempfile.mkstemp(suffix='.md')
+    with os.fdopen(fd, 'w') as f:
+        f.write(
+            f"# Edit Proposed Change\n"
+            f"# Target: {proposal.target_file}\n"
+            f"# Save and close to apply, or delete all content to cancel\n\n"
+            f"{proposal.proposed_change}"
+        )
 
     # Get editor from environment
     editor = os.environ.get('EDITOR', os.environ.get('VISUAL', 'vim'))
 
     try:
         # Open in editor
-        subprocess.run([editor, temp_path], check=True)
+        if _run_editor(editor, temp_path) != 0:
+            console.print("[red]Editor exited with error[/red]")
+            return None
 
         # Read back edited content
-        with open(temp_path) as f:
-            content = f.read()
+        content = Path(temp_path).read_text()
 
-        # Remove comment lines and check if content remains
-        lines = [l for l in content.split('\n') if not l.startswith('#')]
-        edited_change = '\n'.join(lines).strip()
+        # Remove the comment header (only at the top, so markdown headings
+        # in the proposed change survive) and check if content remains
+        lines = content.splitlines()
+        start = 0
+        while start < len(lines) and lines[start].startswith('#'):
+            start += 1
+        edited_change = '\n'.join(lines[start:]).strip()
 
         if not edited_change:
             console.print("[yellow]Edit cancelled (empty content)[/yellow]")
@@ -120,9 +175,6 @@ def edit_proposal(proposal: InstructionProposal) -> Optional[InstructionProposal
         from dataclasses import replace
         return replace(proposal, proposed_change=edited_change)
 
-    except subprocess.CalledProcessError:
-        console.print("[red]Editor exited with error[/red]")
-        return None
     finally:
         # Clean up temp file
         try:
@@ -151,25 +203,19 @@ def show_metrics_comparison(
     table.add_column("After", justify="right")
     table.add_column("Delta", justify="right")
 
-    def delta_style(delta: float) -> str:
-        if delta > 0.001:
-            return f"[green]+{delta:.3f}[/green]"
-        elif delta < -0.001:
-            return f"[red]{delta:.3f}[/red]"
-        else:
-            return f"[dim]{delta:.3f}[/dim]"
+    rows = []
 
     # Core metrics
     for metric in ['f1', 'precision', 'recall']:
         b = before.get(metric, 0)
         a = after.get(metric, 0)
         delta = a - b
-        table.add_row(
+        rows.append((
             metric.upper(),
             f"{b:.3f}",
             f"{a:.3f}",
-            delta_style(delta)
-        )
+            _METRIC_DELTA_FMT[_sign(delta, 0.001)].format(delta),
+        ))
 
     # Error counts
     before_errors = before.get('errors_by_type', {})
@@ -179,14 +225,17 @@ def show_metrics_comparison(
         b = before_errors.get(error_type, 0)
         a = after_errors.get(error_type, 0)
         delta = a - b
-        # For errors, negative delta is good
-        delta_str = f"[green]{delta:+d}[/green]" if delta < 0 else f"[red]{delta:+d}[/red]" if delta > 0 else f"[dim]{delta:+d}[/dim]"
-        table.add_row(
+        rows.append((
             f"  {error_type}",
             str(b),
             str(a),
-            delta_str
-        )
+            _ERROR_DELTA_FMT[_sign(delta)].format(delta),
+        ))
 
-    console.print()
-    console.print(table)
+    for row in rows:
+        table.add_row(*row)
+
+    # Buffer the spacer and table so they reach the terminal in one write
+    with console:
+        console.print()
+        console.print(table)
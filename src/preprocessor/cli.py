@@ -1,5 +1,7 @@
 """CLI entry points for PDF preprocessing."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import click
@@ -8,6 +10,49 @@ from tqdm import tqdm
 from .rasterize import estimate_tokens, rasterize_pdf
 
 
+# PDFs rasterized for each eval case
+EVAL_PDF_NAMES = ("plans.pdf", "spec_sheet.pdf")
+
+
+def _find_eval_pdfs(evals_dir: Path) -> list[Path]:
+    """Find plans/spec sheet PDFs one level down in a single directory scan."""
+    pdf_files = []
+    with os.scandir(evals_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            for name in EVAL_PDF_NAMES:
+                pdf_path = Path(entry.path) / name
+                if pdf_path.is_file():
+                    pdf_files.append(pdf_path)
+    pdf_files.sort()
+    return pdf_files
+
+
+def _rasterize_totals(
+    pdf_path: Path,
+    output_dir: Path,
+    max_edge: int,
+    workers: int | None = None,
+    force: bool = False,
+    assume_exists: bool = False,
+) -> tuple[int, int]:
+    """Rasterize a PDF and return (page count, estimated tokens)."""
+    page_count = 0
+    total_tokens = 0
+    for _, w, h in rasterize_pdf(
+        pdf_path,
+        output_dir,
+        max_longest_edge=max_edge,
+        workers=workers,
+        force=force,
+        assume_exists=assume_exists,
+    ):
+        page_count += 1
+        total_tokens += estimate_tokens(w, h)
+    return page_count, total_tokens
+
+
 @click.group()
 def cli():
     """Takeoff v2 Preprocessor - PDF rasterization for extraction."""
@@ -30,7 +75,25 @@ def cli():
     default=1568,
     help="Max pixels on longest edge (default: 1568)",
 )
-def rasterize_one(pdf_path: Path, output_dir: Path | None, max_edge: int):
+@click.option(
+    "--workers",
+    "-j",
+    type=int,
+    default=None,
+    help="Render processes (default: one per CPU)",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Re-render pages even if their images already exist",
+)
+def rasterize_one(
+    pdf_path: Path,
+    output_dir: Path | None,
+    max_edge: int,
+    workers: int | None,
+    force: bool,
+):
     """
     Rasterize a single PDF to images.
 
@@ -44,12 +107,11 @@ def rasterize_one(pdf_path: Path, output_dir: Path | None, max_edge: int):
 
     click.echo(f"Rasterizing {pdf_path} to {output_dir}")
 
-    pages = rasterize_pdf(pdf_path, output_dir, max_longest_edge=max_edge)
-
-    # Calculate token estimates
-    total_tokens = sum(estimate_tokens(w, h) for _, w, h in pages)
+    page_count, total_tokens = _rasterize_totals(
+        pdf_path, output_dir, max_edge, workers=workers, force=force
+    )
 
-    click.echo(f"Rasterized {len(pages)} pages")
+    click.echo(f"Rasterized {page_count} pages")
     click.echo(f"Output directory: {output_dir}")
     click.echo(f"Estimated tokens: {total_tokens:,}")
 
@@ -71,52 +133,73 @@ def rasterize_one(pdf_path: Path, output_dir: Path | None, max_edge: int):
 @click.option(
     "--force",
     is_flag=True,
-    help="Regenerate even if preprocessed/ exists",
+    help="Re-render pages even if their images already exist",
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=int,
+    default=None,
+    help="PDFs rasterized in parallel (default: one per CPU)",
 )
-def preprocess_all(evals_dir: Path, max_edge: int, force: bool):
+def preprocess_all(
+    evals_dir: Path, max_edge: int, force: bool, workers: int | None
+):
     """
     Preprocess all eval PDFs.
 
     Finds all plans.pdf and spec_sheet.pdf files in the evals directory
-    and rasterizes them to PNG sequences.
+    and rasterizes them to PNG sequences. Pages already rendered intact at
+    this --max-edge are kept (unless --force), so an interrupted run picks
+    up where it stopped.
 
     Example:
         preprocessor preprocess-all
         preprocessor preprocess-all --force
     """
     # Find all PDFs in evals
-    pdf_files = list(evals_dir.glob("*/plans.pdf")) + list(
-        evals_dir.glob("*/spec_sheet.pdf")
-    )
-    pdf_files.sort()
+    pdf_files = _find_eval_pdfs(evals_dir)
 
     click.echo(f"Found {len(pdf_files)} PDFs to process")
 
     total_pages = 0
     total_tokens = 0
     processed_count = 0
-    skipped_count = 0
-
-    for pdf_path in tqdm(pdf_files, desc="Processing PDFs"):
-        output_dir = pdf_path.parent / "preprocessed" / pdf_path.stem
-
-        # Skip if preprocessed directory exists (unless --force)
-        if output_dir.exists() and not force:
-            skipped_count += 1
-            continue
-
-        pages = rasterize_pdf(pdf_path, output_dir, max_longest_edge=max_edge)
 
-        page_tokens = sum(estimate_tokens(w, h) for _, w, h in pages)
-        total_pages += len(pages)
-        total_tokens += page_tokens
-        processed_count += 1
+    # Create every output directory up front rather than once per worker
+    jobs = [
+        (pdf_path, pdf_path.parent / "preprocessed" / pdf_path.stem)
+        for pdf_path in pdf_files
+    ]
+    for output_dir in {output_dir for _, output_dir in jobs}:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    # PDFs are independent, so rasterize them in parallel; each one renders
+    # serially inside its worker to avoid nesting process pools
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _rasterize_totals,
+                pdf_path,
+                output_dir,
+                max_edge,
+                workers=1,
+                force=force,
+                assume_exists=True,
+            )
+            for pdf_path, output_dir in jobs
+        ]
+        for future in tqdm(
+            as_completed(futures), total=len(futures), desc="Processing PDFs"
+        ):
+            page_count, page_tokens = future.result()
+            total_pages += page_count
+            total_tokens += page_tokens
+            processed_count += 1
 
     click.echo("")
     click.echo("Preprocessing complete!")
     click.echo(f"  PDFs processed: {processed_count}")
-    if skipped_count > 0:
-        click.echo(f"  PDFs skipped (already exist): {skipped_count}")
     click.echo(f"  Total pages: {total_pages}")
     click.echo(f"  Total estimated tokens: {total_tokens:,}")
 
@@ -1,8 +1,32 @@
 """PDF to image rasterization for Claude multimodal input."""
 
+import hashlib
+import os
+import shutil
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
+from typing import Iterator, Optional
 
 import pymupdf
+from PIL import Image
+
+
+# Per-process document handle for pool workers (pymupdf docs are not fork-safe,
+# so each worker opens its own copy once in _init_worker)
+_worker_doc: Optional[pymupdf.Document] = None
+
+# Per-process map of rendered page content -> first file written with it
+_worker_seen: dict[tuple[int, int, bytes], Path] = {}
+
+# Pillow raw modes by pixmap component count
+_PIL_MODES = {1: "L", 3: "RGB", 4: "RGBA"}
+
+# Pages rendered ahead of the encoder thread in serial mode
+_ENCODE_AHEAD = 2
 
 
 def estimate_tokens(width: int, height: int) -> int:
@@ -21,12 +45,206 @@ def estimate_tokens(width: int, height: int) -> int:
     return (width * height) // 750
 
 
+@lru_cache(maxsize=16)
+def _zoom_matrix(zoom: float) -> pymupdf.Matrix:
+    """Scaling matrix for a zoom factor, shared by same-size pages."""
+    return pymupdf.Matrix(zoom, zoom)
+
+
+def _save_pixmap(
+    pix: pymupdf.Pixmap, output_path: Path, png_level: Optional[int]
+) -> None:
+    """Encode a pixmap to output_path.
+
+    MuPDF's built-in PNG encoder uses a fixed, fairly expensive deflate
+    level; on dense plan sheets zlib level 1 via Pillow is ~3x faster for
+    a few percent larger files.
+
+    The image is written to a temporary file and renamed into place, so an
+    interrupted encode never leaves a partial page behind for a resumed
+    run to pick up.
+    """
+    tmp_path = _tmp_path(output_path)
+    if png_level is not None and output_path.suffix == ".png":
+        # Wrap the pixmap buffer without copying; Pillow releases the GIL
+        # while deflating, so this can run on a background thread
+        mode = _PIL_MODES[pix.n]
+        img = Image.frombuffer(
+            mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1
+        )
+        img.save(tmp_path, format="PNG", compress_level=png_level)
+    else:
+        pix.save(tmp_path, output=output_path.suffix[1:])
+    # Replacing the directory entry also never writes through a hardlink
+    # shared with a duplicate page
+    os.replace(tmp_path, output_path)
+
+
+def _tmp_path(output_path: Path) -> Path:
+    """Scratch file next to output_path, cleared of any earlier leftover."""
+    tmp_path = output_path.with_suffix(".tmp")
+    tmp_path.unlink(missing_ok=True)
+    return tmp_path
+
+
+def _pixmap_key(pix: pymupdf.Pixmap) -> tuple[int, int, bytes]:
+    """Content key for spotting duplicate pages (cover sheets, blanks)."""
+    digest = hashlib.blake2b(pix.samples_mv, digest_size=16).digest()
+    return pix.width, pix.height, digest
+
+
+def _link_or_copy(source: Path, output_path: Path) -> None:
+    """Reuse an already-encoded page image for an identical page."""
+    tmp_path = _tmp_path(output_path)
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, output_path)
+
+
+def _page_matrix(page: pymupdf.Page, max_longest_edge: int) -> pymupdf.Matrix:
+    """Scaling that fits a page within max_longest_edge."""
+    # Get page dimensions (in points, 72 pts = 1 inch)
+    rect = page.rect
+    longest = max(rect.width, rect.height)
+
+    # Calculate zoom factor - never upscale
+    zoom = min(max_longest_edge / longest, 1.0)
+    return _zoom_matrix(zoom)
+
+
+def _expected_size(page: pymupdf.Page, max_longest_edge: int) -> tuple[int, int]:
+    """(width, height) _render_pixmap produces for a page, without rendering."""
+    irect = (page.rect * _page_matrix(page, max_longest_edge)).irect
+    return irect.width, irect.height
+
+
+def _render_pixmap(page: pymupdf.Page, max_longest_edge: int) -> pymupdf.Pixmap:
+    """Render a page scaled to fit max_longest_edge."""
+    mat = _page_matrix(page, max_longest_edge)
+
+    # Render page to pixmap (alpha=False forces white background)
+    return page.get_pixmap(matrix=mat, alpha=False)
+
+
+def _render_pages_overlapped(
+    doc: pymupdf.Document,
+    page_nums: list[int],
+    output_paths: list[Path],
+    max_longest_edge: int,
+    png_level: Optional[int],
+) -> Iterator[tuple[Path, int, int]]:
+    """Render pages on this thread while a background thread encodes them.
+
+    A page is yielded only once its file is written; at most _ENCODE_AHEAD
+    pixmaps are held in memory at a time. Pages identical to an earlier one
+    are hardlinked to it instead of being encoded again.
+    """
+    in_flight: deque[tuple[Future, tuple[Path, int, int]]] = deque()
+    seen: dict[tuple[int, int, bytes], Path] = {}
+    with ThreadPoolExecutor(max_workers=1) as encoder:
+        for page_num in page_nums:
+            output_path = output_paths[page_num - 1]
+            pix = _render_pixmap(doc[page_num - 1], max_longest_edge)
+            key = _pixmap_key(pix)
+            if key in seen:
+                # The single encoder thread runs jobs in order, so the
+                # first copy is on disk before the link is made
+                future = encoder.submit(_link_or_copy, seen[key], output_path)
+            else:
+                seen[key] = output_path
+                future = encoder.submit(_save_pixmap, pix, output_path, png_level)
+            in_flight.append((future, (output_path, pix.width, pix.height)))
+            # Only the queued job may keep the pixmap alive; dropping our
+            # reference frees it as soon as it is encoded rather than after
+            # the next page has been rendered
+            del pix
+            if len(in_flight) >= _ENCODE_AHEAD:
+                future, result = in_flight.popleft()
+                future.result()
+                yield result
+        while in_flight:
+            future, result = in_flight.popleft()
+            future.result()
+            yield result
+
+
+def _is_complete(path: Path, size: tuple[int, int]) -> bool:
+    """Whether an existing page image is intact and rendered at size.
+
+    Catches images left by a run with a different max_longest_edge and
+    files truncated mid-write (e.g. by versions that wrote in place).
+    """
+    try:
+        with Image.open(path) as img:
+            if img.size != size:
+                return False
+            # verify() walks the PNG chunks and CRCs without decoding;
+            # other formats only notice truncation on a full decode
+            if img.format == "PNG":
+                img.verify()
+            else:
+                img.load()
+    except (OSError, SyntaxError):
+        # Missing, unreadable or truncated (Pillow raises SyntaxError for
+        # some corrupt PNG chunks)
+        return False
+    return True
+
+
+def _init_worker(pdf_path: Path) -> None:
+    """Open the PDF once per worker process."""
+    global _worker_doc
+    _worker_doc = pymupdf.open(pdf_path)
+    _worker_seen.clear()
+
+
+def _render_worker_page(
+    page_num: int,
+    output_path: Path,
+    max_longest_edge: int,
+    png_level: Optional[int],
+) -> tuple[Path, int, int]:
+    """Render a 1-indexed page using the worker's document handle.
+
+    Duplicates are only detected among pages handled by the same worker.
+    """
+    pix = _render_pixmap(_worker_doc[page_num - 1], max_longest_edge)
+    key = _pixmap_key(pix)
+    if key in _worker_seen:
+        _link_or_copy(_worker_seen[key], output_path)
+    else:
+        _save_pixmap(pix, output_path, png_level)
+        _worker_seen[key] = output_path
+    return output_path, pix.width, pix.height
+
+
+def _in_page_order(
+    output_paths: list[Path],
+    sizes: list[tuple[int, int]],
+    pending: list[int],
+    rendered: Iterator[tuple[Path, int, int]],
+) -> Iterator[tuple[Path, int, int]]:
+    """Interleave freshly rendered pages with ones already on disk."""
+    pending_set = set(pending)
+    for page_num, output_path in enumerate(output_paths, 1):
+        if page_num in pending_set:
+            yield next(rendered)
+        else:
+            yield output_path, *sizes[page_num - 1]
+
+
 def rasterize_pdf(
     pdf_path: Path,
     output_dir: Path,
     max_longest_edge: int = 1568,
     output_format: str = "png",
-) -> list[tuple[Path, int, int]]:
+    workers: Optional[int] = None,
+    png_level: Optional[int] = 1,
+    force: bool = False,
+    assume_exists: bool = False,
+) -> Iterator[tuple[Path, int, int]]:
     """
     Rasterize PDF pages to images with maximum resolution limit.
 
@@ -35,42 +253,69 @@ def rasterize_pdf(
     original page is smaller than max_longest_edge, it is rendered
     at its original resolution.
 
+    Pages are produced lazily, so nothing is rendered until the result
+    is iterated.
+
     Args:
         pdf_path: Path to input PDF file
         output_dir: Directory for output images
         max_longest_edge: Maximum pixels on longest edge (default: 1568,
             Claude's recommended max before auto-resize)
         output_format: Image format - "png", "jpeg", or "webp"
+        workers: Number of render processes (default: one per CPU, capped
+            at the page count). 1 renders serially in this process.
+        png_level: zlib compression level (0-9) for PNG output. None uses
+            MuPDF's built-in encoder instead.
+        force: Re-render pages whose image already exists. By default
+            existing pages are kept if intact and at the requested size,
+            so interrupted runs resume.
+        assume_exists: Skip creating output_dir (the caller already did).
 
-    Returns:
-        List of (path, width, height) tuples for each generated image.
+    Yields:
+        (path, width, height) tuples for each page, in page order.
         Useful for token estimation: estimate_tokens(width, height)
     """
-    doc = pymupdf.open(pdf_path)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    results: list[tuple[Path, int, int]] = []
-
-    try:
-        for page_num, page in enumerate(doc, 1):
-            # Get page dimensions (in points, 72 pts = 1 inch)
-            rect = page.rect
-            longest = max(rect.width, rect.height)
-
-            # Calculate zoom factor - never upscale
-            zoom = min(max_longest_edge / longest, 1.0)
-            mat = pymupdf.Matrix(zoom, zoom)
-
-            # Render page to pixmap (alpha=False forces white background)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
+    if not assume_exists:
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save to file with zero-padded page number
-            output_path = output_dir / f"page-{page_num:03d}.{output_format}"
-            pix.save(output_path)
+    # Always close document to free memory, even if iteration stops early
+    with closing(pymupdf.open(pdf_path)) as doc:
+        output_paths = [
+            output_dir / f"page-{page_num:03d}.{output_format}"
+            for page_num in range(1, doc.page_count + 1)
+        ]
+        sizes = [_expected_size(page, max_longest_edge) for page in doc]
+        # Resume interrupted runs: only render pages missing on disk,
+        # damaged, or left over from a run at another size
+        pending = [
+            page_num
+            for page_num, output_path in enumerate(output_paths, 1)
+            if force or not _is_complete(output_path, sizes[page_num - 1])
+        ]
 
-            results.append((output_path, pix.width, pix.height))
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(pending)))
 
-    finally:
-        # Always close document to free memory
-        doc.close()
+        if workers == 1:
+            rendered = _render_pages_overlapped(
+                doc, pending, output_paths, max_longest_edge, png_level
+            )
+            yield from _in_page_order(output_paths, sizes, pending, rendered)
+            return
 
-    return results
+    # Rendering is CPU-bound and independent per page; each worker
+    # reopens the PDF and results come back in page order
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(pdf_path,),
+    ) as executor:
+        rendered = executor.map(
+            _render_worker_page,
+            pending,
+            [output_paths[page_num - 1] for page_num in pending],
+            repeat(max_longest_edge),
+            repeat(png_level),
+        )
+        yield from _in_page_order(output_paths, sizes, pending, rendered)
@@ -1,6 +1,8 @@
 """Pydantic models for document structure mapping during discovery phase."""
+from collections import defaultdict
+
 from pydantic import BaseModel, Field
-from typing import List, Optional, Literal, Dict
+from typing import Any, List, Optional, Literal, Dict, Tuple
 from enum import Enum
 
 
@@ -82,7 +84,13 @@ class PDFSource(BaseModel):
 
 
 class DocumentMap(BaseModel):
-    """Map of document structure with classified pages."""
+    """Map of document structure with classified pages.
+
+    Page queries are answered from an index built in one pass over pages
+    on first use. The index is rebuilt whenever pages is replaced (assignment,
+    model_copy(update=...)), but not when the list is mutated in place, so
+    treat the list (and the returned lists) as read-only once queried.
+    """
     cache_version: int = Field(default=CACHE_VERSION, description="Schema version for cache migration")
     total_pages: int = Field(ge=1, description="Total number of pages in document")
     pages: List[PageInfo] = Field(description="List of classified pages")
@@ -91,6 +99,34 @@ class DocumentMap(BaseModel):
         description="Metadata about source PDFs keyed by name (e.g., {'plans': PDFSource(...)})"
     )
 
+    # ========================================================================
+    # Page index
+    # ========================================================================
+
+    @property
+    def _page_index(self) -> Dict[Tuple[str, Any], List[int]]:
+        """Page numbers keyed by ("type", page_type), ("subtype", s) and ("tag", t)."""
+        # Cached alongside the list it was built from: model_copy() carries
+        # __dict__ over, so a copy with new pages must not reuse the old index.
+        # Kept out of pydantic private attrs, which take part in __eq__.
+        cached = self.__dict__.get("_page_index_cache")
+        if cached is not None and cached[0] is self.pages:
+            return cached[1]
+
+        index: Dict[Tuple[str, Any], List[int]] = defaultdict(list)
+        for p in self.pages:
+            index["type", p.page_type].append(p.page_number)
+            if p.subtype:
+                index["subtype", p.subtype].append(p.page_number)
+            for tag in dict.fromkeys(p.content_tags):
+                index["tag", tag].append(p.page_number)
+        index = dict(index)
+        self.__dict__["_page_index_cache"] = (self.pages, index)
+        return index
+
+    def _indexed(self, kind: str, key: Any) -> List[int]:
+        return self._page_index.get((kind, key), [])
+
     # ========================================================================
     # Core type properties (existing)
     # ========================================================================
@@ -98,17 +134,17 @@ class DocumentMap(BaseModel):
     @property
     def schedule_pages(self) -> List[int]:
         """Return list of page numbers classified as schedules."""
-        return [p.page_number for p in self.pages if p.page_type == PageType.SCHEDULE]
+        return self._indexed("type", PageType.SCHEDULE)
 
     @property
     def cbecc_pages(self) -> List[int]:
         """Return list of page numbers classified as CBECC compliance forms."""
-        return [p.page_number for p in self.pages if p.page_type == PageType.CBECC]
+        return self._indexed("type", PageType.CBECC)
 
     @property
     def drawing_pages(self) -> List[int]:
         """Return list of page numbers classified as architectural drawings."""
-        return [p.page_number for p in self.pages if p.page_type == PageType.DRAWING]
+        return self._indexed("type", PageType.DRAWING)
 
     # ========================================================================
     # Subtype and tag query methods (new)
@@ -116,16 +152,18 @@ class DocumentMap(BaseModel):
 
     def pages_by_subtype(self, subtype: str) -> List[int]:
         """Return page numbers matching a specific subtype."""
-        return [p.page_number for p in self.pages if p.subtype == subtype]
+        return self._indexed("subtype", subtype)
 
     def pages_with_tag(self, tag: str) -> List[int]:
         """Return page numbers containing a specific content tag."""
-        return [p.page_number for p in self.pages if tag in p.content_tags]
+        return self._indexed("tag", tag)
 
     def pages_with_any_tag(self, tags: List[str]) -> List[int]:
-        """Return page numbers containing any of the specified tags."""
-        tag_set = set(tags)
-        return [p.page_number for p in self.pages if tag_set & set(p.content_tags)]
+        """Return page numbers containing any of the specified tags, in page order."""
+        matched = set()
+        for tag in tags:
+            matched.update(self._indexed("tag", tag))
+        return sorted(matched)
 
     # ========================================================================
     # Drawing subtype shortcuts
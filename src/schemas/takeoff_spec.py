@@ -98,15 +98,22 @@ class OrientationWall(BaseModel):
     @property
     def total_fenestration_area(self) -> float:
         """Calculate total fenestration area in this wall."""
-        return sum(
-            (f.area or 0) * f.multiplier
-            for f in self.fenestration
-        )
+        # Plain loop: these lists are short, so generator setup in sum()
+        # dominates. Not cached, since fenestration is reassigned during merge.
+        total = 0.0
+        for f in self.fenestration:
+            if f.area:
+                total += f.area * f.multiplier
+        return total
 
     @property
     def total_door_area(self) -> float:
         """Calculate total opaque door area in this wall."""
-        return sum(d.area or 0 for d in self.opaque_doors)
+        total = 0.0
+        for d in self.opaque_doors:
+            if d.area:
+                total += d.area
+        return total
 
 
 class HouseWalls(BaseModel):
@@ -182,7 +189,11 @@ class ThermalBoundary(BaseModel):
     @property
     def calculated_conditioned_area(self) -> float:
         """Calculate total conditioned floor area from zones."""
-        return sum(z.floor_area or 0 for z in self.conditioned_zones)
+        total = 0.0
+        for z in self.conditioned_zones:
+            if z.floor_area:
+                total += z.floor_area
+        return total
 
 
 # ============================================================================
@@ -8,7 +8,7 @@ TakeoffSpec → BuildingSpec:
 - house_walls.north.fenestration[] → windows[] with wall="N Wall"
 - thermal_boundary.conditioned_zones[] → zones[] with zone_type="Conditioned"
 """
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .takeoff_spec import (
     TakeoffSpec,
@@ -31,12 +31,14 @@ from .building_spec import (
     CeilingComponent,
     SlabFloor,
     HVACSystem,
-    HeatPumpHeating,
-    HeatPumpCooling,
-    DistributionSystem,
     WaterHeatingSystem,
-    WaterHeater,
 )
+from .validation import validate_list
+
+
+# Component helpers below return plain field dicts; each list is then
+# validated in one pydantic-core call (validate_list) instead of one
+# model __init__ per item.
 
 
 # ============================================================================
@@ -57,6 +59,12 @@ ORIENTATION_TO_AZIMUTH = {
     "west": 270.0,
 }
 
+# (wall name, default azimuth) per cardinal orientation, for one lookup per wall
+_CARDINAL_WALL_LABELS = {
+    orientation: (wall_name, ORIENTATION_TO_AZIMUTH[orientation])
+    for orientation, wall_name in ORIENTATION_TO_WALL_NAME.items()
+}
+
 
 def _get_zone_name(takeoff: TakeoffSpec) -> str:
     """Get the primary zone name from TakeoffSpec."""
@@ -69,25 +77,31 @@ def _get_zone_name(takeoff: TakeoffSpec) -> str:
 # Wall Transformation
 # ============================================================================
 
+def _wall_label(orientation: str) -> Tuple[str, float]:
+    """Wall name and default azimuth for an orientation label."""
+    label = _CARDINAL_WALL_LABELS.get(orientation)
+    if label is None:
+        # Only additional walls ("wall_0", ...) need a formatted name
+        return f"{orientation.title()} Wall", 0.0
+    return label
+
+
 def _transform_wall(
-    orientation: str,
     wall: OrientationWall,
-    zone_name: str
-) -> WallComponent:
-    """Transform an OrientationWall to a WallComponent."""
-    wall_name = ORIENTATION_TO_WALL_NAME.get(orientation, f"{orientation.title()} Wall")
-    default_azimuth = ORIENTATION_TO_AZIMUTH.get(orientation, 0.0)
-
-    # Calculate window area from nested fenestration
-    window_area = wall.total_fenestration_area
+    wall_name: str,
+    azimuth: float,
+    zone_name: str,
+    window_area: float
+) -> Dict[str, Any]:
+    """Transform an OrientationWall to WallComponent fields."""
     door_area = wall.total_door_area
 
-    return WallComponent(
+    return dict(
         name=wall_name,
         zone=zone_name,
         status=wall.status,
         construction_type=wall.construction_type,
-        orientation=wall.azimuth if wall.azimuth is not None else default_azimuth,
+        orientation=azimuth,
         area=wall.gross_wall_area,
         window_area=window_area if window_area > 0 else 0.0,
         door_area=door_area if door_area > 0 else 0.0,
@@ -96,35 +110,21 @@ def _transform_wall(
     )
 
 
-def _transform_walls(takeoff: TakeoffSpec) -> List[WallComponent]:
-    """Transform all walls from TakeoffSpec to BuildingSpec format."""
-    walls = []
-    zone_name = _get_zone_name(takeoff)
-
-    for orientation, wall in takeoff.house_walls.get_all_walls():
-        walls.append(_transform_wall(orientation, wall, zone_name))
-
-    return walls
-
-
 # ============================================================================
 # Window Transformation
 # ============================================================================
 
 def _transform_fenestration(
     fenestration: FenestrationEntry,
-    orientation: str,
-    wall: OrientationWall
-) -> WindowComponent:
-    """Transform a FenestrationEntry to a WindowComponent."""
-    wall_name = ORIENTATION_TO_WALL_NAME.get(orientation, f"{orientation.title()} Wall")
-    default_azimuth = ORIENTATION_TO_AZIMUTH.get(orientation, 0.0)
-
-    return WindowComponent(
+    wall_name: str,
+    azimuth: float
+) -> Dict[str, Any]:
+    """Transform a FenestrationEntry to WindowComponent fields."""
+    return dict(
         name=fenestration.name,
         wall=wall_name,
         status=fenestration.status,
-        azimuth=wall.azimuth if wall.azimuth is not None else default_azimuth,
+        azimuth=azimuth,
         height=fenestration.height,
         width=fenestration.width,
         multiplier=fenestration.multiplier,
@@ -135,24 +135,53 @@ def _transform_fenestration(
     )
 
 
-def _transform_windows(takeoff: TakeoffSpec) -> List[WindowComponent]:
-    """Transform all fenestration from TakeoffSpec to BuildingSpec format."""
+def _transform_house_walls(
+    takeoff: TakeoffSpec
+) -> Tuple[List[WallComponent], List[WindowComponent], float, float]:
+    """Transform walls and their nested fenestration in a single pass.
+
+    Returns:
+        (walls, windows, total gross wall area, total window area); the
+        totals are what _transform_envelope falls back on.
+    """
+    walls = []
     windows = []
+    total_wall_area = 0.0
+    total_window_area = 0.0
+    zone_name = _get_zone_name(takeoff)
 
     for orientation, wall in takeoff.house_walls.get_all_walls():
+        wall_name, default_azimuth = _wall_label(orientation)
+        azimuth = wall.azimuth if wall.azimuth is not None else default_azimuth
+
+        # Sum window area while emitting windows rather than re-walking
+        # the list via OrientationWall.total_fenestration_area
+        window_area = 0.0
         for fenestration in wall.fenestration:
-            windows.append(_transform_fenestration(fenestration, orientation, wall))
+            windows.append(_transform_fenestration(fenestration, wall_name, azimuth))
+            if fenestration.area:
+                window_area += fenestration.area * fenestration.multiplier
+        walls.append(_transform_wall(wall, wall_name, azimuth, zone_name, window_area))
 
-    return windows
+        if wall.gross_wall_area:
+            total_wall_area += wall.gross_wall_area
+        total_window_area += window_area
+
+    return (
+        validate_list(WallComponent, walls),
+        validate_list(WindowComponent, windows),
+        total_wall_area,
+        total_window_area,
+    )
 
 
 # ============================================================================
 # Zone Transformation
 # ============================================================================
 
-def _transform_conditioned_zone(zone: ConditionedZone) -> ZoneInfo:
-    """Transform a ConditionedZone to a ZoneInfo."""
-    return ZoneInfo(
+def _transform_conditioned_zone(zone: ConditionedZone) -> Dict[str, Any]:
+    """Transform a ConditionedZone to ZoneInfo fields."""
+    return dict(
         name=zone.name,
         zone_type="Conditioned",
         status="New",  # Default to new
@@ -168,9 +197,9 @@ def _transform_conditioned_zone(zone: ConditionedZone) -> ZoneInfo:
     )
 
 
-def _transform_unconditioned_zone(zone: UnconditionedZone) -> ZoneInfo:
-    """Transform an UnconditionedZone to a ZoneInfo."""
-    return ZoneInfo(
+def _transform_unconditioned_zone(zone: UnconditionedZone) -> Dict[str, Any]:
+    """Transform an UnconditionedZone to ZoneInfo fields."""
+    return dict(
         name=zone.name,
         zone_type="Unconditioned",
         status="New",
@@ -189,16 +218,16 @@ def _transform_zones(takeoff: TakeoffSpec) -> List[ZoneInfo]:
     for zone in takeoff.thermal_boundary.unconditioned_zones:
         zones.append(_transform_unconditioned_zone(zone))
 
-    return zones
+    return validate_list(ZoneInfo, zones)
 
 
 # ============================================================================
 # Ceiling Transformation
 # ============================================================================
 
-def _transform_ceiling(ceiling: CeilingEntry) -> CeilingComponent:
-    """Transform a CeilingEntry to a CeilingComponent."""
-    return CeilingComponent(
+def _transform_ceiling(ceiling: CeilingEntry) -> Dict[str, Any]:
+    """Transform a CeilingEntry to CeilingComponent fields."""
+    return dict(
         name=ceiling.name,
         zone=ceiling.zone,
         status=ceiling.status,
@@ -233,16 +262,16 @@ def _transform_ceilings(takeoff: TakeoffSpec) -> List[CeilingComponent]:
         )
         if is_cathedral:
             cathedral_ceilings.append(_transform_ceiling(c))
-    return cathedral_ceilings
+    return validate_list(CeilingComponent, cathedral_ceilings)
 
 
 # ============================================================================
 # Slab Floor Transformation
 # ============================================================================
 
-def _transform_slab(slab: SlabEntry) -> SlabFloor:
-    """Transform a SlabEntry to a SlabFloor."""
-    return SlabFloor(
+def _transform_slab(slab: SlabEntry) -> Dict[str, Any]:
+    """Transform a SlabEntry to SlabFloor fields."""
+    return dict(
         name=slab.name,
         zone=slab.zone,
         status=slab.status,
@@ -256,22 +285,22 @@ def _transform_slab(slab: SlabEntry) -> SlabFloor:
 
 def _transform_slabs(takeoff: TakeoffSpec) -> List[SlabFloor]:
     """Transform all slabs from TakeoffSpec to BuildingSpec format."""
-    return [_transform_slab(s) for s in takeoff.slab_floors]
+    return validate_list(SlabFloor, [_transform_slab(s) for s in takeoff.slab_floors])
 
 
 # ============================================================================
 # HVAC Transformation
 # ============================================================================
 
-def _transform_hvac(hvac: HVACSystemEntry) -> HVACSystem:
-    """Transform an HVACSystemEntry to an HVACSystem."""
+def _transform_hvac(hvac: HVACSystemEntry) -> Dict[str, Any]:
+    """Transform an HVACSystemEntry to HVACSystem fields."""
     heating = None
     cooling = None
     distribution = None
 
     # Build heating info if available
     if hvac.hspf or hvac.afue or hvac.heating_capacity:
-        heating = HeatPumpHeating(
+        heating = dict(
             system_type=hvac.heating_type,
             hspf=hvac.hspf,
             capacity_47=hvac.heating_capacity,
@@ -280,7 +309,7 @@ def _transform_hvac(hvac: HVACSystemEntry) -> HVACSystem:
 
     # Build cooling info if available
     if hvac.seer2 or hvac.eer2 or hvac.cooling_capacity:
-        cooling = HeatPumpCooling(
+        cooling = dict(
             system_type=hvac.cooling_type,
             seer2=hvac.seer2,
             eer2=hvac.eer2,
@@ -289,14 +318,14 @@ def _transform_hvac(hvac: HVACSystemEntry) -> HVACSystem:
 
     # Build distribution info if available
     if hvac.ducted is not None or hvac.duct_leakage_percent or hvac.duct_r_value:
-        distribution = DistributionSystem(
+        distribution = dict(
             name=f"{hvac.name} Distribution",
             system_type=hvac.duct_location,
             percent_leakage=hvac.duct_leakage_percent,
             insulation_r_value=hvac.duct_r_value,
         )
 
-    return HVACSystem(
+    return dict(
         name=hvac.name,
         status=hvac.status,
         system_type=hvac.system_type,
@@ -308,16 +337,16 @@ def _transform_hvac(hvac: HVACSystemEntry) -> HVACSystem:
 
 def _transform_hvac_systems(takeoff: TakeoffSpec) -> List[HVACSystem]:
     """Transform all HVAC systems from TakeoffSpec to BuildingSpec format."""
-    return [_transform_hvac(h) for h in takeoff.hvac_systems]
+    return validate_list(HVACSystem, [_transform_hvac(h) for h in takeoff.hvac_systems])
 
 
 # ============================================================================
 # DHW Transformation
 # ============================================================================
 
-def _transform_dhw(dhw: DHWSystem) -> WaterHeatingSystem:
-    """Transform a DHWSystem to a WaterHeatingSystem."""
-    water_heater = WaterHeater(
+def _transform_dhw(dhw: DHWSystem) -> Dict[str, Any]:
+    """Transform a DHWSystem to WaterHeatingSystem fields."""
+    water_heater = dict(
         name=dhw.name,
         fuel=dhw.fuel,
         tank_type=dhw.system_type,
@@ -329,7 +358,7 @@ def _transform_dhw(dhw: DHWSystem) -> WaterHeatingSystem:
         tank_location=dhw.location,
     )
 
-    return WaterHeatingSystem(
+    return dict(
         name=dhw.name,
         status=dhw.status,
         system_type=dhw.system_type,
@@ -339,7 +368,7 @@ def _transform_dhw(dhw: DHWSystem) -> WaterHeatingSystem:
 
 def _transform_dhw_systems(takeoff: TakeoffSpec) -> List[WaterHeatingSystem]:
     """Transform all DHW systems from TakeoffSpec to BuildingSpec format."""
-    return [_transform_dhw(d) for d in takeoff.dhw_systems]
+    return validate_list(WaterHeatingSystem, [_transform_dhw(d) for d in takeoff.dhw_systems])
 
 
 # ============================================================================
@@ -371,24 +400,23 @@ def _transform_project(takeoff: TakeoffSpec) -> ProjectInfo:
     )
 
 
-def _transform_envelope(takeoff: TakeoffSpec) -> EnvelopeInfo:
-    """Build EnvelopeInfo from TakeoffSpec data."""
+def _transform_envelope(
+    takeoff: TakeoffSpec,
+    total_wall_area: float,
+    total_window_area: float
+) -> EnvelopeInfo:
+    """Build EnvelopeInfo from TakeoffSpec data and the summed house_walls areas."""
     proj = takeoff.project
 
-    # Calculate totals from house_walls if not specified
-    total_wall_area = 0.0
-    total_window_area = 0.0
-    for _, wall in takeoff.house_walls.get_all_walls():
-        if wall.gross_wall_area:
-            total_wall_area += wall.gross_wall_area
-        total_window_area += wall.total_fenestration_area
-
-    # Use project values if available, otherwise calculated
-    wall_area = proj.exterior_wall_area if proj.exterior_wall_area else total_wall_area
-    window_area = proj.window_area if proj.window_area else total_window_area
+    # Use project values if available (zero counts as unreported), otherwise calculated
+    wall_area = proj.exterior_wall_area or total_wall_area
+    window_area = proj.window_area or total_window_area
 
     # Calculate slab area from slab_floors
-    slab_area = sum(s.area or 0 for s in takeoff.slab_floors)
+    slab_area = 0.0
+    for s in takeoff.slab_floors:
+        if s.area:
+            slab_area += s.area
 
     return EnvelopeInfo(
         conditioned_floor_area=proj.conditioned_floor_area,
@@ -418,7 +446,7 @@ def transform_takeoff_to_building_spec(takeoff: TakeoffSpec) -> BuildingSpec:
         BuildingSpec with component-list structure for verification
     """
     zones = _transform_zones(takeoff)
-    walls = _transform_walls(takeoff)
+    walls, windows, total_wall_area, total_window_area = _transform_house_walls(takeoff)
 
     # Aggregate door area from walls into zone
     if zones:
@@ -427,10 +455,10 @@ def transform_takeoff_to_building_spec(takeoff: TakeoffSpec) -> BuildingSpec:
 
     return BuildingSpec(
         project=_transform_project(takeoff),
-        envelope=_transform_envelope(takeoff),
+        envelope=_transform_envelope(takeoff, total_wall_area, total_window_area),
         zones=zones,
         walls=walls,
-        windows=_transform_windows(takeoff),
+        windows=windows,
         ceilings=_transform_ceilings(takeoff),
         slab_floors=_transform_slabs(takeoff),
         hvac_systems=_transform_hvac_systems(takeoff),
@@ -15,6 +15,7 @@ Usage:
     print(tel.summary())
 """
 import time
+from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
@@ -24,9 +25,10 @@ class Telemetry:
     """Tracks named timing spans with nesting support."""
 
     def __init__(self):
-        self.spans: List[Dict[str, Optional[float | str]]] = []
+        # Times are integer nanoseconds; seconds are only derived for output
+        self.spans: List[Dict[str, Optional[int | str]]] = []
         self._stack: List[str] = []  # current nesting path
-        self._start_time = time.monotonic()
+        self._start_ns = time.monotonic_ns()
 
     @contextmanager
     def span(self, name: str):
@@ -37,22 +39,22 @@ class Telemetry:
             "name": name,
             "full_name": full_name,
             "parent": parent,
-            "start": time.monotonic(),
-            "end": None,
-            "duration": None,
+            "start_ns": time.monotonic_ns(),
+            "end_ns": None,
+            "duration_ns": None,
         }
         self.spans.append(entry)
         self._stack.append(name)
         try:
             yield entry
         finally:
-            entry["end"] = time.monotonic()
-            entry["duration"] = entry["end"] - entry["start"]
+            entry["end_ns"] = time.monotonic_ns()
+            entry["duration_ns"] = entry["end_ns"] - entry["start_ns"]
             self._stack.pop()
 
     def total_seconds(self) -> float:
         """Wall-clock time since telemetry was created."""
-        return time.monotonic() - self._start_time
+        return (time.monotonic_ns() - self._start_ns) / 1e9
 
     def summary(self) -> str:
         """Return formatted timing table."""
@@ -68,9 +70,9 @@ class Telemetry:
         lines.append("\u2500" * 52)
 
         for span in self.spans:
-            dur = span["duration"]
-            if dur is None:
+            if span["duration_ns"] is None:
                 continue
+            dur = span["duration_ns"] / 1e9
             pct = (dur / total) * 100
             indent = "  " if span["parent"] else ""
             prefix = "\u251c\u2500 " if span["parent"] else ""
@@ -85,15 +87,19 @@ class Telemetry:
 
     def to_dict(self) -> Dict:
         """Return JSON-serializable timing data."""
-        def build_tree(spans: List[Dict], parent: Optional[str] = None) -> List[Dict]:
-            children = [s for s in spans if s["parent"] == parent]
+        # Group once by parent so each level is a lookup, not a rescan
+        by_parent: Dict[Optional[str], List[Dict]] = defaultdict(list)
+        for s in self.spans:
+            by_parent[s["parent"]].append(s)
+
+        def build_tree(parent: Optional[str] = None) -> List[Dict]:
             result = []
-            for s in children:
+            for s in by_parent.get(parent, ()):
                 entry = {
                     "name": s["name"],
-                    "duration_seconds": round(s["duration"], 3) if s["duration"] else None,
+                    "duration_seconds": round(s["duration_ns"] / 1e9, 3) if s["duration_ns"] else None,
                 }
-                nested = build_tree(spans, s["full_name"])
+                nested = build_tree(s["full_name"])
                 if nested:
                     entry["children"] = nested
                 result.append(entry)
@@ -102,5 +108,5 @@ class Telemetry:
         return {
             "total_seconds": round(self.total_seconds(), 3),
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "spans": build_tree(self.spans),
+            "spans": build_tree(),
         }
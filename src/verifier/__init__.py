@@ -2,7 +2,6 @@
 from .compare import compare_fields, FieldDiscrepancy
 from .metrics import compute_field_level_metrics
 from .categorize import categorize_error
-from .report import EvalReport, generate_html_report
 from .persistence import EvalStore, save_evaluation, get_next_iteration
 
 __all__ = [
@@ -16,3 +15,11 @@ __all__ = [
     "save_evaluation",
     "get_next_iteration",
 ]
+
+
+def __getattr__(name):
+    # The HTML report pulls in jinja2; load it only when asked for
+    if name in ("EvalReport", "generate_html_report"):
+        from . import report
+        return getattr(report, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
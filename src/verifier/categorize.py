@@ -1,8 +1,18 @@
 """Error type categorization for extraction discrepancies."""
+import re
 from typing import Any
 from .compare import FieldDiscrepancy
 
 
+# Default critical fields for energy modeling
+_DEFAULT_CRITICAL_FIELDS = (
+    "project.climate_zone",
+    "envelope.conditioned_floor_area",
+    "envelope.window_area",
+    "envelope.exterior_wall_area",
+)
+
+
 def categorize_error(expected: Any, actual: Any) -> str:
     """
     Categorize the error type for a field discrepancy.
@@ -66,9 +76,11 @@ def summarize_errors(discrepancies: list[FieldDiscrepancy]) -> dict[str, list[st
         "wrong_value": [],
     }
 
+    # One dict lookup per discrepancy; unknown error types are dropped
     for d in discrepancies:
-        if d.error_type in result:
-            result[d.error_type].append(d.field_path)
+        paths = result.get(d.error_type)
+        if paths is not None:
+            paths.append(d.field_path)
 
     return result
 
@@ -88,13 +100,10 @@ def get_critical_errors(discrepancies: list[FieldDiscrepancy],
         List of discrepancies for critical fields only
     """
     if critical_fields is None:
-        # Default critical fields for energy modeling
-        critical_fields = [
-            "project.climate_zone",
-            "envelope.conditioned_floor_area",
-            "envelope.window_area",
-            "envelope.exterior_wall_area",
-        ]
-
-    return [d for d in discrepancies
-            if any(cf in d.field_path for cf in critical_fields)]
+        critical_fields = _DEFAULT_CRITICAL_FIELDS
+    if not critical_fields:
+        return []
+
+    # One alternation scans each path once for any critical substring
+    search = re.compile("|".join(map(re.escape, critical_fields))).search
+    return [d for d in discrepancies if search(d.field_path)]
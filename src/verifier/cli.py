@@ -1,18 +1,25 @@
 """CLI entry point for Takeoff v2 Verifier."""
 import csv
 import json
-import webbrowser
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import click
-import yaml
 
-from .compare import compare_fields, compare_all_fields, flatten_dict, load_field_mapping
+from .compare import compare_flat_fields, discrepancies_from, flatten_dict, load_field_mapping
 from .metrics import compute_field_level_metrics, compute_aggregate_metrics
-from .report import EvalReport, generate_html_report
 from .persistence import EvalStore, save_evaluation, get_next_iteration
 
 
+# Array notation in mapping paths, e.g. zones[0]
+_ARRAY_PART = re.compile(r'(\w+)\[(\d+)\]')
+
+# Lowercased spellings parse_value treats as booleans
+_BOOL_VALUES = {'yes': True, 'true': True, 'no': False, 'false': False}
+
+
 def parse_value(value_str: str):
     """Parse a string value to appropriate Python type."""
     value_str = value_str.strip().strip('"')
@@ -22,10 +29,14 @@ def parse_value(value_str: str):
         return None
 
     # Handle boolean values
-    if value_str.lower() in ('yes', 'true'):
-        return True
-    if value_str.lower() in ('no', 'false'):
-        return False
+    flag = _BOOL_VALUES.get(value_str.lower())
+    if flag is not None:
+        return flag
+
+    # Neither int() nor a float with a '.' can start with a letter, so
+    # plain text skips the raise/catch below
+    if value_str[0].isalpha():
+        return value_str
 
     # Try to convert to number
     try:
@@ -37,45 +48,71 @@ def parse_value(value_str: str):
         return value_str
 
 
-def set_nested_value_with_arrays(result: dict, json_path: str, value):
-    """Set value in nested dict, handling array notation like zones[0].name."""
-    import re
+@lru_cache(maxsize=None)
+def _split_json_path(json_path: str) -> tuple:
+    """Split a mapping path into ('array', key, idx) / ('key', key, None) parts.
 
-    # Split path and handle array indices
+    Paths come from the field mapping, so each is parsed once per process.
+    """
     parts = []
     for part in json_path.split('.'):
         # Check for array notation like zones[0]
-        match = re.match(r'(\w+)\[(\d+)\]', part)
+        match = _ARRAY_PART.match(part)
         if match:
             parts.append(('array', match.group(1), int(match.group(2))))
         else:
             parts.append(('key', part, None))
+    return tuple(parts)
+
 
+def _padded_list(d: dict, key: str, idx: int) -> list:
+    """Return d[key] as a list long enough to index idx, padding with {}."""
+    items = d.setdefault(key, [])
+    # Pad sparse indices (e.g. zones[5] before zones[0..4]) in one extend
+    missing = idx + 1 - len(items)
+    if missing > 0:
+        items.extend({} for _ in range(missing))
+    return items
+
+
+def _parent_container(result: dict, parts: tuple) -> dict:
+    """Walk (creating as needed) to the dict that holds the last path part."""
     d = result
-    for i, (ptype, key, idx) in enumerate(parts[:-1]):
+    for ptype, key, idx in parts[:-1]:
         if ptype == 'array':
-            if key not in d:
-                d[key] = []
-            # Extend list if needed
-            while len(d[key]) <= idx:
-                d[key].append({})
-            d = d[key][idx]
+            d = _padded_list(d, key, idx)[idx]
         else:
             d = d.setdefault(key, {})
+    return d
+
 
-    # Set final value
-    final_type, final_key, final_idx = parts[-1]
+def _set_leaf(d: dict, part: tuple, value):
+    """Set the final path part on its parent container."""
+    final_type, final_key, final_idx = part
     if final_type == 'array':
-        if final_key not in d:
-            d[final_key] = []
-        while len(d[final_key]) <= final_idx:
-            d[final_key].append({})
-        d[final_key][final_idx] = value
+        _padded_list(d, final_key, final_idx)[final_idx] = value
     else:
         d[final_key] = value
 
 
-def load_ground_truth_csv(csv_path: Path, mapping: dict) -> dict:
+def set_nested_value_with_arrays(result: dict, json_path: str, value):
+    """Set value in nested dict, handling array notation like zones[0].name."""
+    parts = _split_json_path(json_path)
+    _set_leaf(_parent_container(result, parts), parts[-1], value)
+
+
+def build_section_config(mapping: dict) -> dict:
+    """Reverse lookup of array sections: CSV section name -> (json_key, field_mapping)."""
+    section_to_config = {}
+    for json_key, config in mapping.get('array_mappings', {}).items():
+        section_name = config.get('csv_section', '')
+        if section_name:
+            section_to_config[section_name] = (json_key, config.get('fields', {}))
+    return section_to_config
+
+
+def load_ground_truth_csv(csv_path: Path, mapping: dict,
+                          section_to_config: Optional[dict] = None) -> dict:
     """
     Load ground truth from CSV and convert to nested dict structure.
 
@@ -88,67 +125,71 @@ def load_ground_truth_csv(csv_path: Path, mapping: dict) -> dict:
 
     Lines have variable column counts, so we use Python's csv module
     with flexible handling.
+
+    Callers loading several files with one mapping can pass
+    section_to_config from build_section_config to build it only once.
     """
     result = {}
     csv_to_json = mapping.get('csv_to_json', {})
-    array_mappings = mapping.get('array_mappings', {})
-
-    # Build reverse lookup: section name -> (json_key, field_mapping)
-    section_to_config = {}
-    for json_key, config in array_mappings.items():
-        section_name = config.get('csv_section', '')
-        if section_name:
-            section_to_config[section_name] = (json_key, config.get('fields', {}))
-
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        rows = list(csv.reader(f))
+    if section_to_config is None:
+        section_to_config = build_section_config(mapping)
 
     current_section = None
-    current_headers = []
+    current_fields = []
     current_json_key = None
-    current_field_mapping = {}
 
-    for row in rows:
-        # Skip empty rows
-        if not row or all(not cell.strip() for cell in row):
-            current_section = None
-            current_headers = []
-            continue
+    # Parent dict per parent path (e.g. "project"), so fields sharing a
+    # prefix walk it once; containers are still only created when written
+    parents = {}
+
+    # Rows are parsed as they are read rather than materialised first
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        rows = csv.reader(f)
+        for row in rows:
+            # Skip empty rows
+            if not row or not ''.join(row).strip():
+                current_section = None
+                current_fields = []
+                continue
 
-        # Check for array section header (format: ,Section Name:, col1, col2, ...)
-        if len(row) >= 3 and row[1].strip().endswith(':'):
-            section_name = row[1].strip()
-            if section_name in section_to_config:
-                current_section = section_name
-                current_json_key, current_field_mapping = section_to_config[section_name]
-                # Headers are in columns 2+ (after the empty col 0 and section name col 1)
-                current_headers = [h.strip() for h in row[2:]]
+            # Every row shape we read has at least three columns
+            if len(row) < 3:
+                continue
+
+            # Strip the leading columns once for all the checks below
+            field_name = row[1].strip()
+            value = row[2].strip()
+
+            # Check for array section header (format: ,Section Name:, col1, col2, ...)
+            if field_name.endswith(':') and field_name in section_to_config:
+                current_section = field_name
+                current_json_key, field_mapping = section_to_config[field_name]
+                # Headers are in columns 2+ (after the empty col 0 and section name col 1);
+                # map each to its JSON field name once rather than per data row
+                current_fields = []
+                for header in row[2:]:
+                    header = header.strip()
+                    current_fields.append(field_mapping.get(
+                        header, header.lower().replace(' ', '_').replace('(', '').replace(')', '')))
                 # Initialize the array in result
                 if current_json_key not in result:
                     result[current_json_key] = []
                 continue
 
-        # Check for array data row (format: ,,value1, value2, ...)
-        if current_section and len(row) >= 3 and not row[0].strip() and not row[1].strip() and row[2].strip():
-            # This is a data row for the current array section
-            values = row[2:]
-            item = {}
-            for i, header in enumerate(current_headers):
-                if i < len(values) and values[i].strip():
-                    # Map CSV header to JSON field name
-                    json_field = current_field_mapping.get(header, header.lower().replace(' ', '_').replace('(', '').replace(')', ''))
-                    parsed = parse_value(values[i])
-                    if parsed is not None:
-                        item[json_field] = parsed
-            if item:
-                result[current_json_key].append(item)
-            continue
-
-        # Regular key-value field (format: anything, field_name, value, ...)
-        if len(row) >= 3:
-            field_name = row[1].strip() if row[1] else None
-            value = row[2].strip() if row[2] else None
+            # Check for array data row (format: ,,value1, value2, ...)
+            if current_section and not row[0].strip() and not field_name and value:
+                # This is a data row for the current array section
+                item = {}
+                for json_field, cell in zip(current_fields, row[2:]):
+                    if cell.strip():
+                        parsed = parse_value(cell)
+                        if parsed is not None:
+                            item[json_field] = parsed
+                if item:
+                    result[current_json_key].append(item)
+                continue
 
+            # Regular key-value field (format: anything, field_name, value, ...)
             if field_name and field_name in csv_to_json and value:
                 json_path = csv_to_json[field_name]
                 parsed_value = parse_value(value)
@@ -158,15 +199,20 @@ def load_ground_truth_csv(csv_path: Path, mapping: dict) -> dict:
                     continue
 
                 # Set in result dict using path (handles arrays)
-                set_nested_value_with_arrays(result, json_path, parsed_value)
+                parts = _split_json_path(json_path)
+                parent_path = json_path.rpartition('.')[0]
+                parent = parents.get(parent_path)
+                if parent is None:
+                    parent = parents[parent_path] = _parent_container(result, parts)
+                _set_leaf(parent, parts[-1], parsed_value)
 
     return result
 
 
 def load_extracted_json(json_path: Path) -> dict:
     """Load extracted JSON from file."""
-    with open(json_path) as f:
-        return json.load(f)
+    # Bytes go straight to the decoder, which detects UTF-8 itself
+    return json.loads(Path(json_path).read_bytes())
 
 
 @click.group()
@@ -212,14 +258,14 @@ def verify_one(eval_id: str, extracted_json: str, evals_dir: str, output: Option
     # Load extracted JSON
     extracted = load_extracted_json(Path(extracted_json))
 
-    # Compare
-    discrepancies = compare_fields(ground_truth, extracted, mapping)
-    all_field_comparisons = compare_all_fields(ground_truth, extracted, mapping)
-
-    # Flatten for counting
+    # Flatten once for both comparison and counting
     gt_flat = flatten_dict(ground_truth)
     ext_flat = flatten_dict(extracted)
 
+    # Compare
+    all_field_comparisons = compare_flat_fields(gt_flat, ext_flat, mapping)
+    discrepancies = discrepancies_from(all_field_comparisons)
+
     # Compute metrics
     metrics = compute_field_level_metrics(
         discrepancies,
@@ -242,13 +288,15 @@ def verify_one(eval_id: str, extracted_json: str, evals_dir: str, output: Option
         click.echo(f"  {error_type}: {count}")
 
     if discrepancies:
-        click.echo(f"\nField-Level Discrepancies ({len(discrepancies)} total):")
+        # Collected and echoed once; click.echo flushes on every call
+        lines = [f"\nField-Level Discrepancies ({len(discrepancies)} total):"]
         for d in discrepancies[:20]:  # Show first 20
-            click.echo(f"  [{d.error_type}] {d.field_path}")
-            click.echo(f"    Expected: {d.expected}")
-            click.echo(f"    Actual:   {d.actual}")
+            lines.append(f"  [{d.error_type}] {d.field_path}")
+            lines.append(f"    Expected: {d.expected}")
+            lines.append(f"    Actual:   {d.actual}")
         if len(discrepancies) > 20:
-            click.echo(f"  ... and {len(discrepancies) - 20} more")
+            lines.append(f"  ... and {len(discrepancies) - 20} more")
+        click.echo("\n".join(lines))
 
     # Save results if output specified (simple JSON output)
     if output:
@@ -270,6 +318,8 @@ def verify_one(eval_id: str, extracted_json: str, evals_dir: str, output: Option
 
     # Save to iteration directory with HTML report if --save flag
     if save:
+        from .report import EvalReport
+
         store = EvalStore(evals_path)
         iteration = store.get_next_iteration(eval_id)
 
@@ -299,7 +349,7 @@ def verify_one(eval_id: str, extracted_json: str, evals_dir: str, output: Option
             for f in all_field_comparisons
         ]
 
-        # Prepare raw JSON data for display
+        # Prepare raw JSON data for display (also saved as extracted.json)
         extracted_json = json.dumps(extracted, indent=2, default=str)
         ground_truth_json = json.dumps(ground_truth, indent=2, default=str)
 
@@ -330,6 +380,7 @@ def verify_one(eval_id: str, extracted_json: str, evals_dir: str, output: Option
             extracted_data=extracted,
             eval_results=eval_results,
             html_report=html_content,
+            extracted_json=extracted_json,
         )
 
         click.echo(f"\nResults saved to iteration {iteration}:")
@@ -341,6 +392,8 @@ def verify_one(eval_id: str, extracted_json: str, evals_dir: str, output: Option
 
         # Open report in browser if requested
         if open_report:
+            import webbrowser
+
             webbrowser.open(f"file://{report_path.absolute()}")
             click.echo(f"\nOpened report in browser")
 
@@ -372,16 +425,20 @@ def verify_all(evals_dir: str, results_subdir: str, output: Optional[str], save:
         verifier verify-all --exclude canterbury-rd
         verifier verify-all --save
     """
+    import yaml
+
     evals_path = Path(evals_dir)
     mapping = load_field_mapping()
+    section_to_config = build_section_config(mapping)
 
     # Load manifest
     manifest_path = evals_path / "manifest.yaml"
     if not manifest_path.exists():
         raise click.ClickException(f"Manifest not found at {manifest_path}")
 
+    # libyaml when available, as for the field mapping
     with open(manifest_path) as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
     all_metrics = []
     results_by_eval = {}
@@ -410,13 +467,17 @@ def verify_all(evals_dir: str, results_subdir: str, output: Optional[str], save:
             if (results_dir / "extracted.json").exists():
                 extracted_path = results_dir / "extracted.json"
             else:
-                # Check for iteration directories
-                iter_dirs = sorted([d for d in results_dir.iterdir()
-                                   if d.is_dir() and d.name.startswith('iteration-')])
-                if iter_dirs:
-                    latest_iter = iter_dirs[-1]
-                    if (latest_iter / "extracted.json").exists():
-                        extracted_path = latest_iter / "extracted.json"
+                # Check for iteration directories; only the latest is needed,
+                # and DirEntry.is_dir() usually needs no extra stat
+                with os.scandir(results_dir) as entries:
+                    latest_iter = max(
+                        (e.name for e in entries
+                         if e.name.startswith('iteration-') and e.is_dir()),
+                        default=None,
+                    )
+                if latest_iter:
+                    if (results_dir / latest_iter / "extracted.json").exists():
+                        extracted_path = results_dir / latest_iter / "extracted.json"
 
         if not extracted_path:
             skipped_evals.append(eval_id)
@@ -429,13 +490,15 @@ def verify_all(evals_dir: str, results_subdir: str, output: Optional[str], save:
             continue
 
         # Load and compare
-        ground_truth = load_ground_truth_csv(gt_path, mapping)
+        ground_truth = load_ground_truth_csv(gt_path, mapping, section_to_config)
         extracted = load_extracted_json(extracted_path)
 
-        discrepancies = compare_fields(ground_truth, extracted, mapping)
-        all_field_comparisons = compare_all_fields(ground_truth, extracted, mapping)
+        # Flatten once; one comparison pass serves both the discrepancy
+        # list and the full diff
         gt_flat = flatten_dict(ground_truth)
         ext_flat = flatten_dict(extracted)
+        all_field_comparisons = compare_flat_fields(gt_flat, ext_flat, mapping)
+        discrepancies = discrepancies_from(all_field_comparisons)
 
         metrics = compute_field_level_metrics(
             discrepancies,
@@ -496,24 +559,30 @@ def verify_all(evals_dir: str, results_subdir: str, output: Optional[str], save:
     click.echo(f"  Recall:    {aggregate['recall']:.3f}")
     click.echo(f"  F1 Score:  {aggregate['f1']:.3f}")
 
-    click.echo(f"\nPer-Eval Breakdown:")
-    click.echo(f"  {'Eval':<25} {'P':>8} {'R':>8} {'F1':>8} {'Errors':>8}")
-    click.echo(f"  {'-'*25} {'-'*8} {'-'*8} {'-'*8} {'-'*8}")
+    # Collected and echoed once; click.echo flushes on every call
+    lines = [
+        f"\nPer-Eval Breakdown:",
+        f"  {'Eval':<25} {'P':>8} {'R':>8} {'F1':>8} {'Errors':>8}",
+        f"  {'-'*25} {'-'*8} {'-'*8} {'-'*8} {'-'*8}",
+    ]
     for m in all_metrics:
         errors_total = sum(m['errors_by_type'].values())
-        click.echo(f"  {m['eval_id']:<25} {m['precision']:>8.3f} {m['recall']:>8.3f} {m['f1']:>8.3f} {errors_total:>8}")
+        lines.append(f"  {m['eval_id']:<25} {m['precision']:>8.3f} {m['recall']:>8.3f} {m['f1']:>8.3f} {errors_total:>8}")
+    click.echo("\n".join(lines))
 
     # Save to iteration directories with HTML reports if --save flag
     if save:
+        from .report import EvalReport
+
         click.echo(f"\nSaving results to iteration directories...")
+        store = EvalStore(evals_path)
         for eval_id, eval_data in results_by_eval.items():
-            store = EvalStore(evals_path)
             iteration = store.get_next_iteration(eval_id)
 
             # Get history for report
             history = store.get_history(eval_id)
 
-            # Prepare raw JSON data for display
+            # Prepare raw JSON data for display (also saved as extracted.json)
             extracted_json = json.dumps(eval_data['extracted_data'], indent=2, default=str)
             ground_truth_json = json.dumps(eval_data.get('ground_truth_data', {}), indent=2, default=str)
 
@@ -544,6 +613,7 @@ def verify_all(evals_dir: str, results_subdir: str, output: Optional[str], save:
                 extracted_data=eval_data['extracted_data'],
                 eval_results=eval_results,
                 html_report=html_content,
+                extracted_json=extracted_json,
             )
             click.echo(f"  {eval_id}: iteration-{iteration:03d}")
 
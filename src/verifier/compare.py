@@ -1,9 +1,9 @@
 """Field-level comparison logic for extraction evaluation."""
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set
 from pathlib import Path
 import re
-import yaml
 
 
 def normalize_text(text: str, field_path: Optional[str] = None) -> str:
@@ -49,11 +49,21 @@ class FieldDiscrepancy:
         }
 
 
+@lru_cache(maxsize=1)
 def load_field_mapping() -> Dict:
-    """Load field mapping from YAML config."""
+    """Load field mapping from YAML config.
+
+    Parsed once per process; callers share the result and must not mutate it.
+    """
+    # Imported here so merely importing the verifier doesn't load PyYAML
+    import yaml
+
+    # libyaml's loader is ~10x faster on the mapping file; fall back if the
+    # PyYAML build lacks it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     mapping_path = Path(__file__).parent.parent / "schemas" / "field_mapping.yaml"
     with open(mapping_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=loader)
 
 
 def is_non_extractable(field_path: str, exclusion_set: Set[str]) -> bool:
@@ -199,6 +209,20 @@ def compare_all_fields(
 
     Returns all comparisons, including matches.
     """
+    return compare_flat_fields(flatten_dict(ground_truth), flatten_dict(extracted), mapping)
+
+
+def compare_flat_fields(
+    gt_flat: Dict[str, Any],
+    ext_flat: Dict[str, Any],
+    mapping: Optional[Dict] = None
+) -> List[FieldComparison]:
+    """
+    Same as compare_all_fields, for data already run through flatten_dict.
+
+    Callers that also need the flattened field counts flatten once and
+    pass the results here instead of walking the nested dicts twice.
+    """
     if mapping is None:
         mapping = load_field_mapping()
 
@@ -207,9 +231,6 @@ def compare_all_fields(
     non_extractable = set(mapping.get("non_extractable_fields", []))
     comparisons = []
 
-    gt_flat = flatten_dict(ground_truth)
-    ext_flat = flatten_dict(extracted)
-
     # All paths from both sides
     all_paths = set(gt_flat.keys()) | set(ext_flat.keys())
 
@@ -290,7 +311,14 @@ def compare_fields(
     Returns:
         List of FieldDiscrepancy objects for each mismatch
     """
-    comparisons = compare_all_fields(ground_truth, extracted, mapping)
+    return discrepancies_from(compare_all_fields(ground_truth, extracted, mapping))
+
+
+def discrepancies_from(comparisons: List[FieldComparison]) -> List[FieldDiscrepancy]:
+    """Filter compare_all_fields output down to mismatches.
+
+    Lets callers that need both views compare once instead of twice.
+    """
     return [
         FieldDiscrepancy(
             field_path=c.field_path,
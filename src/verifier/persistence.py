@@ -78,6 +78,7 @@ class EvalStore:
         extracted_data: Dict[str, Any],
         eval_results: Dict[str, Any],
         html_report: Optional[str] = None,
+        extracted_json: Optional[str] = None,
     ) -> Path:
         """
         Save evaluation results for an iteration.
@@ -88,6 +89,9 @@ class EvalStore:
             extracted_data: The extracted JSON data
             eval_results: Evaluation results (metrics, discrepancies)
             html_report: Optional HTML report string
+            extracted_json: extracted_data already serialized with
+                json.dumps(..., indent=2, default=str), e.g. for the report;
+                written as-is instead of serializing again
 
         Returns:
             Path to iteration directory
@@ -96,9 +100,9 @@ class EvalStore:
         iter_dir.mkdir(parents=True, exist_ok=True)
 
         # Save extracted data
-        (iter_dir / "extracted.json").write_text(
-            json.dumps(extracted_data, indent=2, default=str)
-        )
+        if extracted_json is None:
+            extracted_json = json.dumps(extracted_data, indent=2, default=str)
+        (iter_dir / "extracted.json").write_text(extracted_json)
 
         # Add timestamp to eval results
         eval_results["timestamp"] = datetime.utcnow().isoformat() + "Z"
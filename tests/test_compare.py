@@ -6,6 +6,8 @@ from verifier.compare import (
     values_match,
     flatten_dict,
     compare_fields,
+    compare_all_fields,
+    discrepancies_from,
 )
 
 
@@ -84,3 +86,10 @@ class TestCompareFields:
         discrepancies = compare_fields(gt, ext)
         wrong = [d for d in discrepancies if d.error_type == "wrong_value"]
         assert len(wrong) == 1
+
+    def test_discrepancies_from_matches_compare_fields(self):
+        gt = {"project": {"city": "Oakland", "zone": 12}}
+        ext = {"project": {"city": "San Jose", "extra_field": "surprise"}}
+        derived = discrepancies_from(compare_all_fields(gt, ext))
+        direct = compare_fields(gt, ext)
+        assert [d.to_dict() for d in derived] == [d.to_dict() for d in direct]
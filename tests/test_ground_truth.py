@@ -0,0 +1,94 @@
+"""Tests for verifier ground-truth CSV loading."""
+import pytest
+from verifier.cli import load_ground_truth_csv, parse_value, set_nested_value_with_arrays
+
+
+MAPPING = {
+    "csv_to_json": {
+        "City": "project.city",
+        "Climate Zone": "project.climate_zone",
+        "Attached Garage": "project.attached_garage",
+        "Zone Name": "zones[2].name",
+    },
+    "array_mappings": {
+        "windows": {
+            "csv_section": "Windows:",
+            "fields": {"Area (ft2)": "area"},
+        },
+    },
+}
+
+GROUND_TRUTH_CSV = """\
+Project,City,Oakland
+,Climate Zone,12
+,Attached Garage,Yes
+,Windows:,Name,Area (ft2),U Factor
+,,W1,12.5,0.30
+,,W2,8,
+,,,,
+,,W3,1,1
+,Zone Name,Living
+,Unmapped Field,ignored
+"""
+
+
+@pytest.fixture
+def ground_truth(tmp_path):
+    csv_path = tmp_path / "ground_truth.csv"
+    csv_path.write_text(GROUND_TRUTH_CSV, encoding="utf-8")
+    return load_ground_truth_csv(csv_path, MAPPING)
+
+
+class TestParseValue:
+    @pytest.mark.parametrize("raw, expected", [
+        ("12", 12),
+        ("1.5", 1.5),
+        ("Yes", True),
+        ("false", False),
+        ("Wood Frame", "Wood Frame"),
+        # Only '.'-containing values go through float()
+        ("nan", "nan"),
+        ("1e3", "1e3"),
+        ('  "7"  ', 7),
+        ("", None),
+    ])
+    def test_values(self, raw, expected):
+        result = parse_value(raw)
+        assert result == expected
+        assert type(result) is type(expected)
+
+
+class TestSetNestedValueWithArrays:
+    def test_sparse_index_pads_with_placeholders(self):
+        result = {}
+        set_nested_value_with_arrays(result, "zones[2].x", 1)
+        assert result == {"zones": [{}, {}, {"x": 1}]}
+
+        set_nested_value_with_arrays(result, "zones[0].x", 0)
+        assert result == {"zones": [{"x": 0}, {}, {"x": 1}]}
+
+
+class TestLoadGroundTruthCsv:
+    def test_key_value_rows(self, ground_truth):
+        assert ground_truth["project"] == {
+            "city": "Oakland",
+            "climate_zone": 12,
+            "attached_garage": True,
+        }
+
+    def test_array_section(self, ground_truth):
+        # "Area (ft2)" is mapped through fields; the others fall back to
+        # snake_case headers. Empty cells are left out.
+        assert ground_truth["windows"] == [
+            {"name": "W1", "area": 12.5, "u_factor": 0.3},
+            {"name": "W2", "area": 8},
+        ]
+
+    def test_blank_row_ends_section(self, ground_truth):
+        assert all(w["name"] != "W3" for w in ground_truth["windows"])
+
+    def test_sparse_array_path(self, ground_truth):
+        assert ground_truth["zones"] == [{}, {}, {"name": "Living"}]
+
+    def test_only_mapped_fields(self, ground_truth):
+        assert set(ground_truth) == {"project", "windows", "zones"}
@@ -0,0 +1,129 @@
+"""Tests for preprocessor PDF rasterization."""
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+
+from PIL import Image
+from preprocessor.rasterize import estimate_tokens, rasterize_pdf
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """Three-page PDF with distinct page sizes."""
+    doc = pymupdf.open()
+    for i, (w, h) in enumerate([(612, 792), (792, 612), (300, 200)]):
+        page = doc.new_page(width=w, height=h)
+        page.insert_text((20, 40), f"Page {i + 1}")
+    path = tmp_path / "plans.pdf"
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class TestEstimateTokens:
+    def test_formula(self):
+        assert estimate_tokens(750, 1) == 1
+        assert estimate_tokens(1568, 1568) == 1568 * 1568 // 750
+
+
+class TestRasterizePdf:
+    def test_serial_renders_all_pages(self, sample_pdf, tmp_path):
+        out = tmp_path / "out"
+        pages = list(rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1))
+        assert [p.name for p, _, _ in pages] == [
+            "page-001.png", "page-002.png", "page-003.png",
+        ]
+        assert all(p.exists() for p, _, _ in pages)
+        # Scaled down to the limit, never upscaled
+        assert max(pages[0][1:]) == 400
+        assert pages[2][1:] == (300, 200)
+
+    def test_parallel_matches_serial(self, sample_pdf, tmp_path):
+        serial = list(rasterize_pdf(sample_pdf, tmp_path / "a", max_longest_edge=400, workers=1))
+        parallel = list(rasterize_pdf(sample_pdf, tmp_path / "b", max_longest_edge=400, workers=2))
+        assert [(p.name, w, h) for p, w, h in serial] == [
+            (p.name, w, h) for p, w, h in parallel
+        ]
+
+    @pytest.mark.parametrize("png_level", [None, 1, 9])
+    def test_png_encoders_produce_same_size(self, sample_pdf, tmp_path, png_level):
+        from PIL import Image
+
+        pages = list(rasterize_pdf(
+            sample_pdf, tmp_path / "out", max_longest_edge=400,
+            workers=1, png_level=png_level,
+        ))
+        for path, w, h in pages:
+            with Image.open(path) as img:
+                assert img.format == "PNG"
+                assert img.size == (w, h)
+
+    def test_existing_pages_are_reused(self, sample_pdf, tmp_path):
+        out = tmp_path / "out"
+        first = list(rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1))
+        # Simulate an interrupted run: page 2 missing, page 1 untouched
+        first[1][0].unlink()
+        mtime = first[0][0].stat().st_mtime_ns
+
+        resumed = list(rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1))
+        assert resumed == first
+        assert first[1][0].exists()
+        assert first[0][0].stat().st_mtime_ns == mtime
+
+    def test_pages_at_another_size_are_rerendered(self, sample_pdf, tmp_path):
+        out = tmp_path / "out"
+        list(rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1))
+
+        smaller = list(rasterize_pdf(sample_pdf, out, max_longest_edge=200, workers=1))
+        fresh = list(rasterize_pdf(sample_pdf, tmp_path / "fresh", max_longest_edge=200, workers=1))
+        assert [(w, h) for _, w, h in smaller] == [(w, h) for _, w, h in fresh]
+        assert max(smaller[0][1:]) == 200
+        for path, w, h in smaller:
+            with Image.open(path) as img:
+                assert img.size == (w, h)
+
+    def test_truncated_pages_are_rerendered(self, sample_pdf, tmp_path):
+        out = tmp_path / "out"
+        first = list(rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1))
+        # Simulate an encode cut off part way through the file
+        data = first[1][0].read_bytes()
+        first[1][0].write_bytes(data[: len(data) // 3])
+
+        resumed = list(rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1))
+        assert resumed == first
+        assert first[1][0].read_bytes() == data
+
+    def test_no_temporary_files_left(self, sample_pdf, tmp_path):
+        out = tmp_path / "out"
+        list(rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1))
+        assert sorted(p.suffix for p in out.iterdir()) == [".png"] * 3
+
+    def test_force_rerenders(self, sample_pdf, tmp_path):
+        out = tmp_path / "out"
+        first = list(rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1))
+        first[0][0].write_bytes(b"")
+        list(rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1, force=True))
+        assert first[0][0].stat().st_size > 0
+
+    def test_is_lazy(self, sample_pdf, tmp_path):
+        out = tmp_path / "out"
+        pages = rasterize_pdf(sample_pdf, out, max_longest_edge=400, workers=1)
+        assert not out.exists()
+        path, _, _ = next(pages)
+        assert path.exists()
+        assert not (out / "page-003.png").exists()
+        pages.close()
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_duplicate_pages_share_one_encode(self, tmp_path, workers):
+        doc = pymupdf.open()
+        for text in ["Cover", "Plan", "Cover"]:
+            doc.new_page(width=300, height=200).insert_text((20, 40), text)
+        pdf_path = tmp_path / "dup.pdf"
+        doc.save(pdf_path)
+        doc.close()
+
+        pages = list(rasterize_pdf(pdf_path, tmp_path / "out", workers=workers))
+        first, second, third = (p.read_bytes() for p, _, _ in pages)
+        assert first == third
+        assert first != second
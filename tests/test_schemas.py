@@ -8,6 +8,8 @@ from schemas.enums import (
 )
 from schemas.building_spec import ProjectInfo, ProjectInfoBase, BuildingSpec
 from schemas.takeoff_spec import TakeoffSpec, TakeoffProjectInfo
+from schemas.discovery import DocumentMap
+from schemas.transform import transform_takeoff_to_building_spec
 
 
 class TestEnums:
@@ -84,3 +86,113 @@ class TestTakeoffProjectInfo:
 
         with pytest.raises(Exception):
             TakeoffProjectInfo(front_orientation=360.0)
+
+
+def _document_map():
+    return DocumentMap.model_validate({
+        "total_pages": 4,
+        "pages": [
+            {"page_number": 1, "page_type": "drawing", "confidence": "high",
+             "subtype": "site_plan", "content_tags": ["north_arrow"]},
+            {"page_number": 2, "page_type": "drawing", "confidence": "high",
+             "subtype": "floor_plan", "content_tags": ["room_labels", "area_callouts"]},
+            {"page_number": 3, "page_type": "schedule", "confidence": "medium",
+             "subtype": "window_schedule", "content_tags": ["glazing_performance"]},
+            {"page_number": 4, "page_type": "cbecc", "confidence": "high",
+             "content_tags": ["hvac_specs", "area_callouts"]},
+        ],
+    })
+
+
+class TestDocumentMap:
+    def test_page_type_lists(self):
+        doc_map = _document_map()
+        assert doc_map.drawing_pages == [1, 2]
+        assert doc_map.schedule_pages == [3]
+        assert doc_map.cbecc_pages == [4]
+
+    def test_subtype_and_tag_queries(self):
+        doc_map = _document_map()
+        assert doc_map.site_plan_pages == [1]
+        assert doc_map.window_schedule_pages == [3]
+        assert doc_map.elevation_pages == []
+        assert doc_map.pages_with_tag("area_callouts") == [2, 4]
+        assert doc_map.pages_with_any_tag(["north_arrow", "hvac_specs"]) == [1, 4]
+
+    def test_cached_lists_do_not_leak_into_dump_or_equality(self):
+        doc_map = _document_map()
+        assert doc_map.floor_plan_pages == [2]
+        assert doc_map == _document_map()
+        assert "floor_plan_pages" not in doc_map.model_dump()
+        assert DocumentMap.model_validate_json(doc_map.model_dump_json()) == doc_map
+
+    def test_index_follows_replaced_pages(self):
+        doc_map = _document_map()
+        assert doc_map.drawing_pages == [1, 2]
+
+        copied = doc_map.model_copy(update={"pages": doc_map.pages[2:]})
+        assert copied.drawing_pages == []
+        assert copied.schedule_pages == [3]
+        assert doc_map.drawing_pages == [1, 2]
+
+        doc_map.pages = doc_map.pages[:1]
+        assert doc_map.drawing_pages == [1]
+        assert doc_map.pages_with_tag("area_callouts") == []
+
+    def test_copies_keep_working_index(self):
+        doc_map = _document_map()
+        assert doc_map.site_plan_pages == [1]
+        assert doc_map.model_copy().site_plan_pages == [1]
+        assert doc_map.model_copy(deep=True).site_plan_pages == [1]
+
+
+def _takeoff_spec():
+    return TakeoffSpec.model_validate({
+        "project": {"climate_zone": 12, "conditioned_floor_area": 1200.0},
+        "house_walls": {
+            "north": {
+                "gross_wall_area": 300.0,
+                "azimuth": 10.0,
+                "fenestration": [
+                    {"name": "W1", "area": 12.0, "multiplier": 2},
+                    {"name": "W2", "area": 6.0},
+                ],
+                "opaque_doors": [{"name": "D1", "area": 20.0}],
+            },
+            "east": {"gross_wall_area": 200.0},
+        },
+        "thermal_boundary": {
+            "conditioned_zones": [{"name": "Living", "floor_area": 1200.0}],
+            "unconditioned_zones": [{"name": "Garage", "floor_area": 400.0}],
+        },
+        "ceilings": [
+            {"name": "Vaulted", "ceiling_type": "cathedral", "area": 100.0},
+            {"name": "Attic", "area": 900.0},
+        ],
+        "hvac_systems": [{"name": "HP1", "hspf": 9.0, "ducted": True}],
+        "dhw_systems": [{"name": "WH1", "tank_volume": 50.0}],
+    })
+
+
+class TestTransformTakeoff:
+    def test_walls_and_windows(self):
+        spec = transform_takeoff_to_building_spec(_takeoff_spec())
+        assert [(w.name, w.orientation) for w in spec.walls] == [("N Wall", 10.0), ("E Wall", 90.0)]
+        assert spec.walls[0].window_area == 30.0
+        assert spec.walls[0].door_area == 20.0
+        assert [(w.name, w.wall, w.azimuth) for w in spec.windows] == [
+            ("W1", "N Wall", 10.0), ("W2", "N Wall", 10.0),
+        ]
+        assert spec.envelope.exterior_wall_area == 500.0
+        assert spec.envelope.window_area == 30.0
+
+    def test_zones_ceilings_and_systems(self):
+        spec = transform_takeoff_to_building_spec(_takeoff_spec())
+        assert [(z.name, z.zone_type) for z in spec.zones] == [
+            ("Living", "Conditioned"), ("Garage", "Unconditioned"),
+        ]
+        assert spec.zones[0].exterior_wall_door_area == 20.0
+        assert [c.name for c in spec.ceilings] == ["Vaulted"]
+        assert spec.hvac_systems[0].heating.hspf == 9.0
+        assert spec.hvac_systems[0].distribution.name == "HP1 Distribution"
+        assert spec.water_heating_systems[0].water_heaters[0].volume == 50.0